@@ -1,21 +1,108 @@
 """``AbstractDataSet`` implementation to access Snowflake using Snowpark dataframes
 """
+import io
 import logging
-from copy import deepcopy
-from typing import Any, Dict, Union
+import sys
+import threading
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import singledispatch
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NoReturn, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import snowflake.snowpark as sp
+from snowflake.connector.errors import NotSupportedError
+from snowflake.connector.pandas_tools import write_pandas
 
 from kedro.io.core import AbstractDataSet, DataSetError
 
 logger = logging.getLogger(__name__)
 
+# connection parameters excluded from the session cache key: secrets, and
+# database/schema as all tables are accessed with fully qualified names
+_SESSION_KEY_EXCLUDED = {"password", "private_key", "database", "schema"}
+
+# non-secret connection parameters kept for ``_describe``
+_DESCRIBE_PARAMETERS = {"account", "warehouse", "database", "schema", "role"}
+
+# snowpark ``save_as_table`` modes mapped to ADBC ``adbc_ingest`` modes
+_ADBC_INGEST_MODES = {
+    "append": "create_append",
+    "overwrite": "replace",
+    "errorifexists": "create",
+}
+
+# values accepted by snowpark ``save_as_table``
+_SAVE_MODES = {"append", "overwrite", "errorifexists", "ignore", "truncate"}
+_SAVE_COLUMN_ORDERS = {"index", "name"}
+_SAVE_TABLE_TYPES = {"", "temp", "temporary", "transient"}
+
+# ``save_as_table`` arguments honoured by the pandas save paths, any other
+# is applied by saving through a snowpark dataframe instead
+_PANDAS_SAVE_ARGS = {"mode", "table_type", "column_order"}
+
+# temporary file format used to infer table schema from staged Parquet files
+_PARQUET_FILE_FORMAT = "KEDRO_PARQUET_FORMAT"
+
+# snowflake python connector parameters mapped to ADBC database options
+_ADBC_DB_KWARGS = {
+    "account": "adbc.snowflake.sql.account",
+    "user": "username",
+    "password": "password",
+    "database": "adbc.snowflake.sql.db",
+    "schema": "adbc.snowflake.sql.schema",
+    "warehouse": "adbc.snowflake.sql.warehouse",
+    "role": "adbc.snowflake.sql.role",
+    "host": "adbc.snowflake.sql.uri.host",
+    "port": "adbc.snowflake.sql.uri.port",
+    "token": "adbc.snowflake.sql.client_option.auth_token",
+    "authenticator": "adbc.snowflake.sql.auth_type",
+}
+
+# snowflake python connector authenticators mapped to ADBC auth types
+_ADBC_AUTH_TYPES = {
+    "snowflake": "auth_snowflake",
+    "externalbrowser": "auth_ext_browser",
+    "oauth": "auth_oauth",
+    "username_password_mfa": "auth_mfa",
+}
+
+
+def _raise(message: str) -> NoReturn:
+    raise DataSetError(message)
+
+
+def _session_key(connection_parameters: Dict[str, Any]) -> frozenset:
+    """Returns the key of the shared session for ``connection_parameters``."""
+    return frozenset(
+        (k, str(v))
+        for k, v in connection_parameters.items()
+        if k not in _SESSION_KEY_EXCLUDED
+    )
+
+
+def _stored_identifier(identifier: str) -> str:
+    """Returns the name Snowflake stores for ``identifier``: unquoted
+    identifiers are upper-cased, double-quoted ones are kept as written.
+    """
+    if len(identifier) > 1 and identifier[0] == identifier[-1] == '"':
+        return identifier[1:-1].replace('""', '"')
+    return identifier.upper()
+
 
 class SnowParkDataSet(
     AbstractDataSet[pd.DataFrame, pd.DataFrame]
 ):
     """``SnowParkDataSet`` loads and saves Snowpark dataframes.
+    Besides Snowpark dataframes, pandas dataframes, ``pyarrow.Table`` and
+    polars dataframes can be saved. With ``use_adbc`` save_arg these
+    are ingested as Arrow record batches through the Snowflake ADBC driver,
+    otherwise Arrow and polars data is uploaded as Parquet without
+    converting it to pandas.
 
     Example adding a catalog entry with
     `YAML API <https://kedro.readthedocs.io/en/stable/data/\
@@ -78,8 +165,16 @@ class SnowParkDataSet(
     # for parallelism within a pipeline please consider
     # ``ThreadRunner`` instead
     _SINGLE_PROCESS = True
-    DEFAULT_LOAD_ARGS = {}  # type: Dict[str, Any]
-    DEFAULT_SAVE_ARGS = {}  # type: Dict[str, Any]
+    # read-only and flat, so a shallow copy per instance is enough
+    DEFAULT_LOAD_ARGS = MappingProxyType({})  # type: Mapping[str, Any]
+    DEFAULT_SAVE_ARGS = MappingProxyType({})  # type: Mapping[str, Any]
+    # sessions shared by all instances connecting with the same parameters
+    _SESSIONS = {}  # type: Dict[frozenset, sp.Session]
+    _SESSIONS_LOCK = threading.Lock()
+    # account of each session, as sessions do not switch accounts
+    _ACCOUNTS = (
+        weakref.WeakKeyDictionary()
+    )  # type: weakref.WeakKeyDictionary[sp.Session, str]
 
     # TODO: Update docstring
     def __init__(  # pylint: disable=too-many-arguments
@@ -103,13 +198,48 @@ class SnowParkDataSet(
                 Optional as can be provided as part of ``credentials``
                 dictionary. Argument value takes priority over one provided
                 in ``credentials`` if any.
-            load_args: Currently not used
+            load_args: Options for loading the table. ``as_arrow: True``
+                fetches the table as a ``pyarrow.Table`` by downloading the
+                result batches with ``parallel`` threads (4 by default)
+                instead of returning a lazy snowpark dataframe.
+                ``cache: True`` materialises the table once per session with
+                ``cache_result`` and returns that temporary table on
+                subsequent loads until the dataset is saved again.
+                ``async_exists: True`` submits the existence check
+                asynchronously before the table is loaded and awaits it
+                afterwards, so the check overlaps with the load, a missing
+                table raises ``DataSetError`` and a later ``exists`` call
+                does not query again.
             save_args: Provided to underlying snowpark ``save_as_table``
                 To find all supported arguments, see here:
                 https://docs.snowflake.com/en/developer-guide/snowpark/reference/python/api/snowflake.snowpark.DataFrameWriter.saveAsTable.html
+                Additionally ``use_adbc: True`` saves pandas, Arrow and
+                polars data as Arrow record batches via the Snowflake ADBC driver
+                (``adbc-driver-snowflake``) if installed and the credentials
+                can be expressed as ADBC options (password, OAuth token,
+                external browser or MFA authentication). Otherwise Arrow and
+                polars data, and pandas dataframes with ``method: copy``, are
+                uploaded as a single Parquet file to the user stage and
+                loaded with ``COPY INTO``. Other pandas dataframes are
+                written with the connector's ``write_pandas`` in chunks of
+                ``chunk_size`` rows (100000 by default) uploaded with
+                ``parallel`` threads (4 by default).
+                These paths match columns by name and only apply the
+                ``mode`` and ``table_type`` options of ``save_as_table``.
+                With ``column_order: index`` or any other option, pandas,
+                Arrow and polars data is saved through a snowpark dataframe
+                built with ``create_dataframe`` instead. Invalid ``mode``,
+                ``column_order`` or ``table_type`` values raise
+                ``DataSetError``.
+                Credentials are only kept after the session is created
+                when ``use_adbc`` is set.
             credentials: A dictionary with a snowpark connection string.
                 To find all supported arguments, see here:
                 https://docs.snowflake.com/en/user-guide/python-connector-api.html#connect
+                If the session is closed later on, the dataset switches to
+                the shared session for the same credentials if another
+                dataset has reconnected, and raises ``DataSetError``
+                otherwise.
         """
 
         if not table_name:
@@ -118,50 +248,145 @@ class SnowParkDataSet(
         if not credentials:
             raise DataSetError("'credentials' argument cannot be empty.")
 
-        if not database:
-            if not ("database" in credentials and credentials["database"]):
-                raise DataSetError("'database' must be provided by credentials or dataset.")
-            else:
-                database = credentials["database"]
-
-        if not schema:
-            if not ("schema" in credentials and credentials["schema"]):
-                raise DataSetError("'schema' must be provided by credentials or dataset.")
-            else:
-                schema = credentials["schema"]
-
+        database = (
+            database
+            or credentials.get("database")
+            or _raise("'database' must be provided by credentials or dataset.")
+        )
+        schema = (
+            schema
+            or credentials.get("schema")
+            or _raise("'schema' must be provided by credentials or dataset.")
+        )
 
         # Handle default load and save arguments
-        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        self._load_args = dict(self.DEFAULT_LOAD_ARGS)
         if load_args is not None:
             self._load_args.update(load_args)
-        self._save_args = deepcopy(self.DEFAULT_SAVE_ARGS)
+        self._save_args = dict(self.DEFAULT_SAVE_ARGS)
         if save_args is not None:
             self._save_args.update(save_args)
+        self._use_adbc = self._save_args.pop("use_adbc", False)
+        self._save_method = self._save_args.pop("method", None)
+        self._parallel = self._save_args.pop("parallel", 4)
+        self._chunk_size = self._save_args.pop("chunk_size", 100_000)
+        self._check_save_args()
+        # whether pandas, Arrow and polars data can skip ``create_dataframe``
+        self._native_save = set(self._save_args) <= _PANDAS_SAVE_ARGS and (
+            self._save_args.get("column_order", "name") == "name"
+        )
 
         self._table_name = table_name
         self._database = database
         self._schema = schema
-
-        connection_parameters = credentials
-        connection_parameters.update(
-            {"database": self._database,
-            "schema": self._schema
-             }
+        self._fqtn_parts = [self._database, self._schema, self._table_name]
+        self._fqtn = ".".join(self._fqtn_parts)
+        # names as stored by Snowflake, for APIs that quote identifiers
+        self._stored_database, self._stored_schema, self._stored_table_name = (
+            _stored_identifier(part) for part in self._fqtn_parts
+        )
+        # constant query text with bind variables lets the result cache hit
+        self._exists_sql = (
+            f"SELECT COUNT(*) FROM {self._database}.INFORMATION_SCHEMA.TABLES "
+            "WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?"
         )
 
+        connection_parameters = {
+            **credentials,
+            "database": self._database,
+            "schema": self._schema,
+        }
+
+        # full parameters are only kept until the session is created
         self._connection_parameters = connection_parameters
-        self._session = self._get_session(self._connection_parameters)
+        # key of the shared session, to find it again once ours is closed
+        self._sess_key = _session_key(connection_parameters)
+        self._conn_meta = {
+            k: v
+            for k, v in connection_parameters.items()
+            if k in _DESCRIBE_PARAMETERS
+        }
+        # ADBC opens its own connection on every save, so it needs credentials
+        self._adbc_db_kwargs = (
+            self._get_adbc_db_kwargs(connection_parameters)
+            if self._use_adbc
+            else None
+        )
+        # result of ``_exists``, reset whenever the table is written to
+        self._table_exists = None  # type: Optional[bool]
+        self._sess = None  # type: Optional[sp.Session]
+        # guards lazy session creation and async check under ``ThreadRunner``
+        self._lock = threading.Lock()
+        # temporary table from ``cache_result``, reset on save
+        self._cached_table = None  # type: Optional[sp.Table]
+
+    def _get_adbc_db_kwargs(
+        self, connection_parameters: Dict[str, Any]
+    ) -> Optional[Dict[str, str]]:
+        """Maps connection parameters to ADBC database options. Returns
+        ``None`` if some of them cannot be expressed in ADBC, so that
+        saves fall back rather than connect with partial credentials.
+        """
+        unmapped = sorted(set(connection_parameters) - set(_ADBC_DB_KWARGS))
+        authenticator = connection_parameters.get("authenticator")
+        if authenticator and authenticator.lower() not in _ADBC_AUTH_TYPES:
+            unmapped.append("authenticator")
+        if unmapped:
+            logger.warning(
+                "Credentials %s cannot be passed to the ADBC driver, "
+                "'use_adbc' is ignored.",
+                unmapped,
+            )
+            return None
+
+        parameters = {
+            **connection_parameters,
+            "database": self._stored_database,
+            "schema": self._stored_schema,
+        }
+        if authenticator:
+            parameters["authenticator"] = _ADBC_AUTH_TYPES[authenticator.lower()]
+        return {
+            _ADBC_DB_KWARGS[key]: str(value)
+            for key, value in parameters.items()
+            if value
+        }
 
     def _describe(self) -> Dict[str, Any]:
-        return dict(
-            table_name=self._table_name,
-            database=self._database,
-            schema=self._schema,
+        return dict(table_name=self._table_name, **self._conn_meta)
+
+    @property
+    def _session(self) -> sp.Session:
+        """Snowpark session, only created (or taken from the shared ones)
+        on first use so that building a catalog does not connect.
+        """
+        session = self._sess
+        if session is None or session._conn.is_closed():  # pylint: disable=protected-access
+            with self._lock:
+                if self._sess is None:
+                    self._sess = self._get_session(self._connection_parameters)
+                    self._connection_parameters = None
+                elif self._sess._conn.is_closed():  # pylint: disable=protected-access
+                    self._sess = self._get_open_session()
+                session = self._sess
+        return session
+
+    def _get_open_session(self) -> sp.Session:
+        """Replaces a closed session with the shared session for the same
+        connection parameters, if one is open. Credentials are not kept,
+        so the dataset cannot connect again by itself.
+        """
+        with self._SESSIONS_LOCK:
+            session = self._SESSIONS.get(self._sess_key)
+        if session is not None and not session._conn.is_closed():  # pylint: disable=protected-access
+            return session
+        raise DataSetError(
+            f"Snowpark session used by the dataset for '{self._fqtn}' "
+            f"was closed. Create the dataset again to reconnect."
         )
 
-    @staticmethod
-    def _get_session(connection_parameters) -> sp.Session:
+    @classmethod
+    def _get_session(cls, connection_parameters) -> sp.Session:
         """Given a connection string, create singleton connection
         to be used across all instances of `SnowParkDataSet` that
         need to connect to the same source.
@@ -178,43 +403,309 @@ class SnowParkDataSet(
                 "schema": "", (optional)
                 "authenticator: "" (optional)
                 }
+        New sessions default to ``client_session_keep_alive: True`` unless
+        set otherwise in ``connection_parameters``.
         """
-        try:
-            logger.debug("Trying to reuse active snowpark session...")
-            # if hook is implemented, get active session
-            session = sp.context.get_active_session()
-        except sp.exceptions.SnowparkSessionException as exc:
+        key = _session_key(connection_parameters)
+        with cls._SESSIONS_LOCK:
+            session = cls._SESSIONS.get(key)
+            if session is not None:
+                if not session._conn.is_closed():  # pylint: disable=protected-access
+                    return session
+                # closed elsewhere, drop it and connect again
+                del cls._SESSIONS[key]
+
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Trying to reuse active snowpark session...")
+            try:
+                # if hook is implemented, get active session
+                active = sp.context.get_active_session()
+            except sp.exceptions.SnowparkSessionException:
+                active = None
+            # sessions created here count as active too, but may belong to
+            # another account or role. An active session owned by a hook is
+            # not cached, as the hook may close it
+            if active is not None and all(
+                active is not pooled for pooled in cls._SESSIONS.values()
+            ):
+                return active
+
             # create session if there is no active one
-            logger.debug("No active snowpark session found. Creating")
-            session = sp.Session.builder.configs(connection_parameters).create()
+            if debug:
+                logger.debug("No active snowpark session found. Creating")
+            # keep the shared session's connection warm between queries
+            session = sp.Session.builder.configs(
+                {"client_session_keep_alive": True, **connection_parameters}
+            ).create()
+            cls._SESSIONS[key] = session
         return session
 
-    def _load(self) -> sp.DataFrame:
-        table_name = [
-            self._database,
-            self._schema,
-            self._table_name,
-        ]
+    def _load(self) -> Union[sp.Table, pa.Table]:
+        exists_job = self._submit_exists()
+        if self._load_args.get("as_arrow"):
+            data = self._load_arrow()
+        elif not self._load_args.get("cache"):
+            data = self._session.table(self._fqtn)
+        else:
+            if self._cached_table is None:
+                self._cached_table = self._session.table(self._fqtn).cache_result()
+            data = self._cached_table
+
+        if exists_job is not None and not self._set_exists(exists_job.result()):
+            raise DataSetError(f"Table '{self._fqtn}' does not exist.")
+        return data
+
+    def _load_arrow(self) -> pa.Table:
+        """Fetches the whole table as Arrow, downloading result batches
+        in parallel. Raises ``DataSetError`` if the session returns results
+        as JSON, which cannot be converted to Arrow.
+        """
+        with self._session._conn._conn.cursor() as cursor:  # pylint: disable=protected-access
+            cursor.execute(f"SELECT * FROM {self._fqtn}")
+            batches = cursor.get_result_batches()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self._load_args.get("parallel", 4)
+            ) as executor:
+                tables = list(executor.map(lambda batch: batch.to_arrow(), batches))
+        except NotSupportedError as exc:
+            raise DataSetError(
+                f"Cannot load '{self._fqtn}' as Arrow: {exc}. Set the "
+                f"'PYTHON_CONNECTOR_QUERY_RESULT_FORMAT' session parameter "
+                f"to 'ARROW' or do not use 'as_arrow'."
+            ) from exc
+        return pa.concat_tables(tables)
+
+    def _adbc_ingest(self, data: pa.Table) -> bool:
+        """Writes Arrow table to the table as record batches
+        using the Snowflake ADBC driver. Returns ``False`` if the driver
+        is not available or the save ``mode`` or ``table_type`` cannot be
+        expressed in ADBC, or the credentials cannot be mapped to it.
+        """
+        mode = _ADBC_INGEST_MODES.get(self._save_args.get("mode", "errorifexists"))
+        if (
+            mode is None
+            or self._save_args.get("table_type")
+            or self._adbc_db_kwargs is None
+        ):
+            return False
 
-        sp_df = self._session.table(".".join(table_name))
-        return sp_df
+        try:
+            from adbc_driver_snowflake import (  # pylint: disable=import-outside-toplevel
+                dbapi,
+            )
+        except ImportError:
+            logger.warning(
+                "'adbc-driver-snowflake' is not installed, "
+                "falling back to uploading through a stage."
+            )
+            return False
+
+        with dbapi.connect(db_kwargs=self._adbc_db_kwargs) as conn:
+            with conn.cursor() as cursor:
+                cursor.adbc_ingest(self._stored_table_name, data, mode=mode)
+            conn.commit()
+        return True
+
+    def _check_save_args(self) -> None:
+        """Raises if ``save_args`` hold values ``save_as_table`` rejects,
+        so that a bad catalog entry fails before anything is saved.
+        Save mode is normalised to lower case as snowpark does.
+        """
+        for key, allowed in (
+            ("mode", _SAVE_MODES),
+            ("column_order", _SAVE_COLUMN_ORDERS),
+            ("table_type", _SAVE_TABLE_TYPES),
+        ):
+            value = self._save_args.get(key)
+            if value is None:
+                continue
+            if not isinstance(value, str) or value.lower() not in allowed:
+                raise DataSetError(
+                    f"Invalid save argument '{key}: {value}', "
+                    f"must be one of {sorted(allowed)}."
+                )
+            self._save_args[key] = value.lower()
+
+    def _prepare_table(self, mode: str) -> bool:
+        """Applies snowpark ``ignore``, ``errorifexists`` and ``truncate``
+        save modes for the pandas save paths, which only support append
+        or overwrite. Returns ``False`` if nothing should be written.
+        """
+        if mode in ("ignore", "errorifexists", "truncate") and self._exists():
+            if mode == "ignore":
+                return False
+            if mode == "errorifexists":
+                raise DataSetError(f"Table '{self._fqtn}' already exists.")
+            self._session.sql(f"TRUNCATE TABLE {self._fqtn}").collect()
+        return True
+
+    def _write_pandas(self, data: pd.DataFrame) -> None:
+        """Writes pandas dataframe with the connector's ``write_pandas``,
+        which uploads Parquet chunks to a stage in parallel.
+        """
+        mode = self._save_args.get("mode", "errorifexists")
+        if not self._prepare_table(mode):
+            return
+
+        write_pandas(
+            self._session._conn._conn,  # pylint: disable=protected-access
+            data,
+            self._stored_table_name,
+            database=self._stored_database,
+            schema=self._stored_schema,
+            chunk_size=self._chunk_size,
+            parallel=self._parallel,
+            auto_create_table=True,
+            overwrite=mode == "overwrite",
+            table_type=self._save_args.get("table_type", ""),
+        )
 
-    def _save(self, data: Union[pd.DataFrame, sp.DataFrame]) -> None:
-        if not isinstance(data, sp.DataFrame):
-            sp_df = self._session.create_dataframe(data)
+    def _copy_into(self, data: pa.Table) -> None:
+        """Uploads Arrow table as a Parquet file to the user stage
+        and loads it into the table with ``COPY INTO``, creating the table
+        from the file schema when needed.
+        """
+        mode = self._save_args.get("mode", "errorifexists")
+        if not self._prepare_table(mode):
+            return
+
+        table_exists = self._exists()
+        stage_path = f"@~/kedro_{uuid.uuid4().hex}.parquet"
+        buffer = io.BytesIO()
+        pq.write_table(data, buffer, compression="snappy")
+        buffer.seek(0)
+        self._session.file.put_stream(buffer, stage_path, auto_compress=False)
+        try:
+            if mode == "overwrite" or not table_exists:
+                self._session.sql(
+                    "CREATE TEMPORARY FILE FORMAT IF NOT EXISTS "
+                    f"{_PARQUET_FILE_FORMAT} TYPE = PARQUET"
+                ).collect()
+                self._session.sql(
+                    f"CREATE OR REPLACE {self._save_args.get('table_type', '')} "
+                    f"TABLE {self._fqtn} USING TEMPLATE ("
+                    "SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*)) FROM TABLE(INFER_SCHEMA("
+                    f"LOCATION => '{stage_path}', "
+                    f"FILE_FORMAT => '{_PARQUET_FILE_FORMAT}')))"
+                ).collect()
+            self._session.sql(
+                f"COPY INTO {self._fqtn} FROM {stage_path} "
+                "FILE_FORMAT = (TYPE = PARQUET) "
+                "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE"
+            ).collect()
+        finally:
+            self._session.sql(f"REMOVE {stage_path}").collect()
+
+    def _check_session(self, data: sp.DataFrame) -> None:
+        """Makes sure a dataframe from another session can be written
+        server-side. ``save_as_table`` runs in the dataframe's own session,
+        which is fine within the same account, but would write to the
+        wrong place for a different one.
+        """
+        source = data._session  # pylint: disable=protected-access
+        if source is self._session:
+            return
+        source_account = self._get_account(source)
+        target_account = self._get_account(self._session)
+        if source_account != target_account:
+            raise DataSetError(
+                f"Cannot save a snowpark dataframe from account "
+                f"'{source_account}' to '{self._fqtn}' in account "
+                f"'{target_account}'. Load it through a session connected "
+                f"to the target account instead."
+            )
+
+    @classmethod
+    def _get_account(cls, session: sp.Session) -> str:
+        """Returns the account of ``session``, only querying it once."""
+        account = cls._ACCOUNTS.get(session)
+        if account is None:
+            account = session.get_current_account()
+            cls._ACCOUNTS[session] = account
+        return account
+
+    def _save_snowpark(self, data: sp.DataFrame) -> None:
+        self._check_session(data)
+        data.write.save_as_table(self._fqtn_parts, **self._save_args)
+
+    def _save_pandas(self, data: pd.DataFrame) -> None:
+        if not self._native_save:
+            self._save_snowpark(self._session.create_dataframe(data))
+            return
+        if self._use_adbc and self._adbc_ingest(
+            pa.Table.from_pandas(data, preserve_index=False)
+        ):
+            return
+        self._upload_pandas(data)
+
+    def _save_arrow(self, data: pa.Table) -> None:
+        if not self._native_save:
+            self._save_pandas(data.to_pandas())
+            return
+        if self._use_adbc and self._adbc_ingest(data):
+            return
+        self._copy_into(data)
+
+    def _save_other(self, data: Any) -> None:
+        # polars is optional, so it is only checked for once imported
+        polars = sys.modules.get("polars")
+        if polars is not None and isinstance(data, polars.DataFrame):
+            self._save_arrow(data.to_arrow())
+            return
+        # anything else snowpark can build a dataframe from
+        self._save_snowpark(self._session.create_dataframe(data))
+
+    def _upload_pandas(self, data: pd.DataFrame) -> None:
+        if self._save_method == "copy":
+            self._copy_into(pa.Table.from_pandas(data, preserve_index=False))
         else:
-            sp_df = data
+            self._write_pandas(data)
 
-        table_name = [
-            self._database,
-            self._schema,
-            self._table_name,
-        ]
+    def _save(
+        self, data: Union[pd.DataFrame, pa.Table, "pl.DataFrame", sp.DataFrame]
+    ) -> None:
+        self._table_exists = None
+        self._cached_table = None
+        self._SAVE_DISPATCH.dispatch(data.__class__)(self, data)
+        # save modes may have checked for the table before it was written
+        with self._lock:
+            self._table_exists = True
+
+    def _submit_exists(self) -> Optional[sp.AsyncJob]:
+        """Submits the existence check for ``_load`` to await, unless
+        ``async_exists`` is not set or the result is already known.
+        """
+        if not self._load_args.get("async_exists") or self._table_exists is not None:
+            return None
+        return self._exists_query(self._session).collect_nowait()
 
-        sp_df.write.save_as_table(table_name, **self._save_args)
+    def _set_exists(self, rows: list) -> bool:
+        """Caches the result of the existence check in ``rows``, unless a
+        save has set it meanwhile, and returns it.
+        """
+        exists = rows[0][0] == 1
+        with self._lock:
+            if self._table_exists is None:
+                self._table_exists = exists
+        return exists
+
+    def _exists_query(self, session: sp.Session) -> sp.DataFrame:
+        return session.sql(
+            self._exists_sql, params=[self._stored_schema, self._stored_table_name]
+        )
 
     def _exists(self) -> bool:
-        session = self._session
-        query = "SELECT COUNT(*) FROM {database}.INFORMATION_SCHEMA.TABLES WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'"
-        rows = session.sql(query.format(database = self._database, schema = self._schema, table_name = self._table_name)).collect()
-        return rows[0][0] == 1
+        if self._table_exists is None:
+            return self._set_exists(self._exists_query(self._session).collect())
+        return self._table_exists
+
+    # save method per data type, resolved along the type's MRO, anything
+    # unregistered goes to ``_save_other``
+    _SAVE_DISPATCH = singledispatch(_save_other)
+    _SAVE_DISPATCH.register(sp.DataFrame, _save_snowpark)
+    _SAVE_DISPATCH.register(pd.DataFrame, _save_pandas)
+    _SAVE_DISPATCH.register(pa.Table, _save_arrow)
+    # keep the dispatcher from binding to instances like a method
+    _SAVE_DISPATCH = staticmethod(_SAVE_DISPATCH)
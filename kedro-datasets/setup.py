@@ -74,7 +74,11 @@ spark_require = {
     "spark.DeltaTableDataSet": [SPARK, HDFS, S3FS, "delta-spark~=1.0"],
 }
 snowpark_require = {
-    "snowflake.SnowParkDataSet": ["snowflake-snowpark-python~=1.0.0", "pyarrow==8.0"]
+    "snowflake.SnowParkDataSet": [
+        "snowflake-snowpark-python~=1.5",
+        "snowflake-connector-python[pandas]>=3.0.4, <4.0",
+        "pyarrow>=10.0.1",
+    ]
 }
 tensorflow_required = {
     "tensorflow.TensorflowModelDataset": [
@@ -1,9 +1,15 @@
 import pytest
 import snowflake.snowpark as sp
+from kedro.io import DataSetError
+from snowflake.connector.errors import NotSupportedError
 from kedro_datasets.snowflake import SnowParkDataSet as spds
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import datetime
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 def get_connection():
@@ -84,7 +90,90 @@ def sample_pandas_df() -> pd.DataFrame:
             },
             columns=["name", "age", "bday", "height", "insert_dttm"]
     )
-    
+
+
+@pytest.fixture
+def credentials():
+    return {
+        "account": "ab12345.eu-central-1",
+        "warehouse": "datascience_wh",
+        "database": "DETAILED_DATA",
+        "schema": "OBSERVATIONS",
+        "user": "service_account_abc",
+        "password": "supersecret",
+    }
+
+
+@pytest.fixture(autouse=True)
+def cleanup_sessions():
+    yield
+    spds._SESSIONS.clear()
+    spds._ACCOUNTS.clear()
+
+
+@pytest.fixture
+def mocked_session_builder(mocker):
+    """Snowpark session builder creating mocked open sessions, with
+    no active session available."""
+    mocker.patch.object(
+        sp.context,
+        "get_active_session",
+        side_effect=sp.exceptions.SnowparkSessionException("No active session"),
+    )
+
+    def create():
+        session = mocker.MagicMock()
+        session._conn.is_closed.return_value = False
+        return session
+
+    builder = mocker.patch.object(sp.Session, "builder")
+    builder.configs.return_value.create.side_effect = create
+    return builder
+
+
+@pytest.fixture
+def registering_session_builder(mocker):
+    """Snowpark session builder whose sessions register as active, like
+    ``Session.__init__`` does, so a single one is the active session."""
+    active = []
+
+    def get_active_session():
+        if len(active) == 1:
+            return active[0]
+        raise sp.exceptions.SnowparkSessionException("No single active session")
+
+    mocker.patch.object(
+        sp.context, "get_active_session", side_effect=get_active_session
+    )
+
+    def create():
+        session = mocker.MagicMock()
+        session._conn.is_closed.return_value = False
+        active.append(session)
+        return session
+
+    builder = mocker.patch.object(sp.Session, "builder")
+    builder.configs.return_value.create.side_effect = create
+    return builder
+
+
+@pytest.fixture
+def mocked_session(mocker):
+    """Mocked session on which the table does not exist yet."""
+    session = mocker.MagicMock()
+    session._conn.is_closed.return_value = False
+    session.sql.return_value.collect.return_value = [[0]]
+    mocker.patch.object(spds, "_get_session", return_value=session)
+    return session
+
+
+@pytest.fixture
+def mocked_write_pandas(mocker):
+    return mocker.patch(
+        "kedro_datasets.snowflake.snowpark_dataset.write_pandas"
+    )
+
+
 @pytest.fixture
 def sf_session():
     sf_session = sp.Session.builder.configs(get_connection()).create()
@@ -106,6 +195,21 @@ class TestSnowParkDataSet:
         sp_df_saved = sf_session.table("KEDRO_PYTEST_TESTSAVE")
         assert sp_df_saved.count() == 2
 
+    @pytest.mark.snowflake
+    def test_save_copy(self, sample_pandas_df, sf_session):
+        sp_df = spds(table_name = 'KEDRO_PYTEST_TESTSAVE', credentials = get_connection(),
+                     save_args = {'method': 'copy'})
+        sp_df._save(sample_pandas_df)
+        sp_df_saved = sf_session.table("KEDRO_PYTEST_TESTSAVE")
+        assert sp_df_saved.count() == 2
+
+    @pytest.mark.snowflake
+    def test_save_lower_case_table_name(self, sample_pandas_df, sf_session):
+        data_set = spds(table_name = 'kedro_pytest_testsave', credentials = get_connection())
+        data_set.save(sample_pandas_df)
+        assert data_set.exists()
+        assert data_set.load().count() == 2
+
     @pytest.mark.snowflake
     def test_load(self, sample_pandas_df, sf_session):
         df_sf = spds(table_name = 'KEDRO_PYTEST_TESTLOAD', credentials = get_connection())._load()
@@ -115,6 +219,14 @@ class TestSnowParkDataSet:
         # fails on that
         assert pandas_equals_ignore_dtype(sample_pandas_df, sf) == True
 
+    @pytest.mark.snowflake
+    def test_load_as_arrow(self, sample_pandas_df, sf_session):
+        df_sf = spds(table_name = 'KEDRO_PYTEST_TESTLOAD', credentials = get_connection(),
+                     load_args = {'as_arrow': True})._load()
+        sf = df_sf.to_pandas()
+
+        assert pandas_equals_ignore_dtype(sample_pandas_df, sf) == True
+
     @pytest.mark.snowflake
     def test_exists(self, sf_session):
         df_e = spds(table_name = 'KEDRO_PYTEST_TESTEXISTS',
@@ -123,4 +235,535 @@ class TestSnowParkDataSet:
                   credentials=get_connection())
         assert df_e._exists() == True
         assert df_ne._exists() == False
-        return
\ No newline at end of file
+        return
+
+
+class TestSnowParkDataSetInit:
+    def test_credentials_not_mutated(self, credentials):
+        original = dict(credentials)
+        spds(table_name="WEATHER_DATA", database="METEOROLOGY", credentials=credentials)
+        spds(table_name="GEOPOLYGONS", schema="GEODATA", credentials=credentials)
+        assert credentials == original
+
+    def test_empty_table_name(self, credentials):
+        with pytest.raises(DataSetError, match="'table_name' argument cannot be empty."):
+            spds(table_name="", credentials=credentials)
+
+    def test_empty_credentials(self):
+        with pytest.raises(DataSetError, match="'credentials' argument cannot be empty."):
+            spds(table_name="WEATHER_DATA", credentials={})
+
+    @pytest.mark.parametrize("key", ["database", "schema"])
+    def test_missing_database_or_schema(self, credentials, key):
+        credentials.pop(key)
+        pattern = f"'{key}' must be provided by credentials or dataset."
+        with pytest.raises(DataSetError, match=pattern):
+            spds(table_name="WEATHER_DATA", credentials=credentials)
+
+    def test_arguments_take_priority(self, credentials):
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            database="METEOROLOGY",
+            schema="GEODATA",
+            credentials=credentials,
+        )
+        assert data_set._fqtn == "METEOROLOGY.GEODATA.WEATHER_DATA"
+
+    @pytest.mark.parametrize(
+        "save_args",
+        [{"mode": "merge"}, {"column_order": "position"}, {"table_type": "external"}],
+    )
+    def test_invalid_save_args(self, credentials, save_args):
+        with pytest.raises(DataSetError, match="Invalid save argument"):
+            spds(table_name="WEATHER_DATA", credentials=credentials, save_args=save_args)
+
+    def test_save_mode_case_insensitive(self, credentials):
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            save_args={"mode": "Overwrite"},
+        )
+        assert data_set._save_args == {"mode": "overwrite"}
+
+    def test_describe(self, credentials):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        assert data_set._describe() == {
+            "table_name": "WEATHER_DATA",
+            "account": "ab12345.eu-central-1",
+            "warehouse": "datascience_wh",
+            "database": "DETAILED_DATA",
+            "schema": "OBSERVATIONS",
+        }
+
+
+class TestSnowParkDataSetSession:
+    def test_session_not_created_on_init(self, credentials, mocked_session_builder):
+        spds(table_name="WEATHER_DATA", credentials=credentials)
+        mocked_session_builder.configs.assert_not_called()
+
+    def test_session_shared(self, credentials, mocked_session_builder):
+        first = spds(table_name="WEATHER_DATA", credentials=credentials)
+        second = spds(table_name="GEOPOLYGONS", credentials=credentials)
+        assert first._session is second._session
+        mocked_session_builder.configs.return_value.create.assert_called_once()
+
+    def test_session_shared_across_schemas(self, credentials, mocked_session_builder):
+        first = spds(table_name="WEATHER_DATA", credentials=credentials)
+        second = spds(table_name="GEOPOLYGONS", schema="GEODATA", credentials=credentials)
+        assert first._session is second._session
+
+    def test_session_different_account(
+        self, credentials, registering_session_builder
+    ):
+        first = spds(table_name="WEATHER_DATA", credentials=credentials)
+        first_session = first._session
+        second = spds(
+            table_name="WEATHER_DATA",
+            credentials={**credentials, "account": "xy67890.eu-central-1"},
+        )
+        assert second._session is not first_session
+        assert registering_session_builder.configs.return_value.create.call_count == 2
+
+    def test_closed_session_recreated(self, credentials, mocked_session_builder):
+        first = spds(table_name="WEATHER_DATA", credentials=credentials)
+        closed = first._session
+        closed._conn.is_closed.return_value = True
+        second = spds(table_name="GEOPOLYGONS", credentials=credentials)
+        assert second._session is not closed
+        assert mocked_session_builder.configs.return_value.create.call_count == 2
+
+    def test_closed_session_replaced_by_shared(
+        self, credentials, mocked_session_builder
+    ):
+        first = spds(table_name="WEATHER_DATA", credentials=credentials)
+        closed = first._session
+        closed._conn.is_closed.return_value = True
+        second = spds(table_name="GEOPOLYGONS", credentials=credentials)
+        reconnected = second._session
+        assert reconnected is not closed
+        assert first._session is reconnected
+
+    def test_closed_session_error(self, credentials, mocked_session_builder):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        data_set._session._conn.is_closed.return_value = True
+        with pytest.raises(DataSetError, match="was closed"):
+            data_set.exists()
+
+    def test_connection_parameters_dropped(self, credentials, mocked_session_builder):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        data_set._session
+        assert data_set._connection_parameters is None
+        assert "supersecret" not in str(data_set)
+
+    def test_session_created_once_across_threads(
+        self, credentials, mocked_session_builder
+    ):
+        create = mocked_session_builder.configs.return_value.create
+        session = create.side_effect()
+        create.side_effect = lambda: time.sleep(0.1) or session
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(executor.map(lambda _: data_set._session, range(4)))
+        assert all(s is session for s in sessions)
+        create.assert_called_once()
+
+    def test_active_session_not_cached(self, credentials, mocker):
+        active = mocker.MagicMock()
+        mocker.patch.object(sp.context, "get_active_session", return_value=active)
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        assert data_set._session is active
+        assert not spds._SESSIONS
+
+
+class TestSnowParkDataSetSave:
+    def test_exists_after_save(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        assert not data_set.exists()
+        data_set.save(sample_pandas_df)
+        mocked_write_pandas.assert_called_once()
+        assert data_set.exists()
+
+    def test_exists_after_copy_save(
+        self, credentials, mocked_session, sample_pandas_df
+    ):
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            save_args={"method": "copy"},
+        )
+        data_set.save(sample_pandas_df)
+        assert data_set.exists()
+
+    def test_save_snowpark_same_session(self, credentials, mocked_session, mocker):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        sp_df = mocker.MagicMock(spec=sp.DataFrame)
+        sp_df._session = mocked_session
+        data_set.save(sp_df)
+        sp_df.write.save_as_table.assert_called_once_with(
+            ["DETAILED_DATA", "OBSERVATIONS", "WEATHER_DATA"]
+        )
+        mocked_session.get_current_account.assert_not_called()
+
+    def test_save_snowpark_other_session_same_account(
+        self, credentials, mocked_session, mocker
+    ):
+        mocked_session.get_current_account.return_value = '"AB12345"'
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        sp_df = mocker.MagicMock(spec=sp.DataFrame)
+        sp_df._session = mocker.MagicMock()
+        sp_df._session.get_current_account.return_value = '"AB12345"'
+        data_set.save(sp_df)
+        data_set.save(sp_df)
+        assert sp_df.write.save_as_table.call_count == 2
+        mocked_session.get_current_account.assert_called_once()
+        sp_df._session.get_current_account.assert_called_once()
+
+    def test_save_snowpark_other_account(self, credentials, mocked_session, mocker):
+        mocked_session.get_current_account.return_value = '"AB12345"'
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        sp_df = mocker.MagicMock(spec=sp.DataFrame)
+        sp_df._session = mocker.MagicMock()
+        sp_df._session.get_current_account.return_value = '"XY67890"'
+        pattern = r"Cannot save a snowpark dataframe from account"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.save(sp_df)
+        sp_df.write.save_as_table.assert_not_called()
+
+    def test_save_pandas_stored_names(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        data_set = spds(
+            table_name="weather_data", schema='"Observations"', credentials=credentials
+        )
+        data_set.save(sample_pandas_df)
+        _, args, kwargs = mocked_write_pandas.mock_calls[0]
+        assert args[2] == "WEATHER_DATA"
+        assert kwargs["database"] == "DETAILED_DATA"
+        assert kwargs["schema"] == "Observations"
+        mocked_session.sql.assert_any_call(
+            data_set._exists_sql, params=["Observations", "WEATHER_DATA"]
+        )
+
+    def test_save_pandas_docstring_save_args(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            save_args={"mode": "overwrite", "column_order": "name", "table_type": "transient"},
+        )
+        data_set.save(sample_pandas_df)
+        _, _, kwargs = mocked_write_pandas.mock_calls[0]
+        assert kwargs["overwrite"]
+        assert kwargs["table_type"] == "transient"
+
+    @pytest.mark.parametrize(
+        "save_args",
+        [
+            {"comment": "weather", "statement_params": {"QUERY_TAG": "kedro"}},
+            {"mode": "append", "clustering_keys": ["BDAY"]},
+            {"column_order": "index"},
+        ],
+    )
+    def test_save_pandas_snowpark_save_args(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df,
+        save_args
+    ):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials, save_args=save_args)
+        sp_df = mocked_session.create_dataframe.return_value
+        sp_df._session = mocked_session
+        data_set.save(sample_pandas_df)
+        mocked_session.create_dataframe.assert_called_once_with(sample_pandas_df)
+        sp_df.write.save_as_table.assert_called_once_with(
+            ["DETAILED_DATA", "OBSERVATIONS", "WEATHER_DATA"], **save_args
+        )
+        mocked_write_pandas.assert_not_called()
+
+    def test_save_arrow_snowpark_save_args(
+        self, credentials, mocked_session, sample_pandas_df
+    ):
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            save_args={"comment": "weather"},
+        )
+        sp_df = mocked_session.create_dataframe.return_value
+        sp_df._session = mocked_session
+        data_set.save(pa.Table.from_pandas(sample_pandas_df, preserve_index=False))
+        pd.testing.assert_frame_equal(
+            mocked_session.create_dataframe.call_args[0][0], sample_pandas_df
+        )
+        sp_df.write.save_as_table.assert_called_once()
+        mocked_session.file.put_stream.assert_not_called()
+
+    def test_save_pandas_truncate(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        mocked_session.sql.return_value.collect.return_value = [[1]]
+        data_set = spds(
+            table_name="WEATHER_DATA", credentials=credentials, save_args={"mode": "truncate"}
+        )
+        data_set.save(sample_pandas_df)
+        mocked_session.sql.assert_any_call(
+            "TRUNCATE TABLE DETAILED_DATA.OBSERVATIONS.WEATHER_DATA"
+        )
+        _, _, kwargs = mocked_write_pandas.mock_calls[0]
+        assert not kwargs["overwrite"]
+
+    def test_save_pandas_ignore_existing(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        mocked_session.sql.return_value.collect.return_value = [[1]]
+        data_set = spds(
+            table_name="WEATHER_DATA", credentials=credentials, save_args={"mode": "ignore"}
+        )
+        data_set.save(sample_pandas_df)
+        mocked_write_pandas.assert_not_called()
+
+    def test_save_pandas_error_if_exists(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        mocked_session.sql.return_value.collect.return_value = [[1]]
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        with pytest.raises(DataSetError, match="already exists"):
+            data_set.save(sample_pandas_df)
+
+    def test_save_snowpark_table(self, credentials, mocked_session, mocker):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        sp_table = mocker.MagicMock(spec=sp.Table)
+        sp_table._session = mocked_session
+        data_set.save(sp_table)
+        sp_table.write.save_as_table.assert_called_once()
+
+    def test_save_other_data(self, credentials, mocked_session):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        sp_df = mocked_session.create_dataframe.return_value
+        sp_df._session = mocked_session
+        data_set.save([["John", 23], ["Jane", 41]])
+        mocked_session.create_dataframe.assert_called_once_with(
+            [["John", 23], ["Jane", 41]]
+        )
+        sp_df.write.save_as_table.assert_called_once()
+
+    def test_save_arrow(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        arrow_table = pa.Table.from_pandas(sample_pandas_df, preserve_index=False)
+        data_set.save(arrow_table)
+        buffer = mocked_session.file.put_stream.call_args[0][0]
+        buffer.seek(0)
+        assert pq.read_table(buffer).equals(arrow_table)
+        queries = [c[0][0] for c in mocked_session.sql.call_args_list]
+        assert any(q.startswith("COPY INTO") for q in queries)
+        mocked_write_pandas.assert_not_called()
+
+    def test_save_polars(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        pl = pytest.importorskip("polars")
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        data_set.save(pl.from_pandas(sample_pandas_df))
+        buffer = mocked_session.file.put_stream.call_args[0][0]
+        buffer.seek(0)
+        assert pq.read_table(buffer).column_names == list(sample_pandas_df.columns)
+        mocked_write_pandas.assert_not_called()
+
+    def test_save_arrow_adbc(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df, mocker
+    ):
+        adbc = mocker.MagicMock()
+        mocker.patch.dict(
+            "sys.modules",
+            {"adbc_driver_snowflake": adbc, "adbc_driver_snowflake.dbapi": adbc.dbapi},
+        )
+        data_set = spds(
+            table_name="weather_data",
+            credentials=credentials,
+            save_args={"use_adbc": True, "mode": "overwrite"},
+        )
+        arrow_table = pa.Table.from_pandas(sample_pandas_df)
+        data_set.save(arrow_table)
+
+        db_kwargs = adbc.dbapi.connect.call_args[1]["db_kwargs"]
+        assert db_kwargs["adbc.snowflake.sql.db"] == "DETAILED_DATA"
+        assert db_kwargs["password"] == "supersecret"
+        conn = adbc.dbapi.connect.return_value.__enter__.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.adbc_ingest.assert_called_once_with(
+            "WEATHER_DATA", arrow_table, mode="replace"
+        )
+        mocked_write_pandas.assert_not_called()
+
+    def test_save_arrow_adbc_authenticator(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df, mocker
+    ):
+        adbc = mocker.MagicMock()
+        mocker.patch.dict(
+            "sys.modules",
+            {"adbc_driver_snowflake": adbc, "adbc_driver_snowflake.dbapi": adbc.dbapi},
+        )
+        credentials.pop("password")
+        credentials.update({"authenticator": "OAUTH", "token": "abc", "port": 443})
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            save_args={"use_adbc": True, "mode": "append"},
+        )
+        data_set.save(pa.Table.from_pandas(sample_pandas_df))
+        db_kwargs = adbc.dbapi.connect.call_args[1]["db_kwargs"]
+        assert db_kwargs["adbc.snowflake.sql.auth_type"] == "auth_oauth"
+        assert db_kwargs["adbc.snowflake.sql.client_option.auth_token"] == "abc"
+        assert db_kwargs["adbc.snowflake.sql.uri.port"] == "443"
+        mocked_write_pandas.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "extra_credentials",
+        [{"private_key": b"key"}, {"authenticator": "https://example.okta.com"}],
+    )
+    def test_save_arrow_adbc_unmapped_credentials(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df,
+        mocker, extra_credentials
+    ):
+        adbc = mocker.MagicMock()
+        mocker.patch.dict(
+            "sys.modules",
+            {"adbc_driver_snowflake": adbc, "adbc_driver_snowflake.dbapi": adbc.dbapi},
+        )
+        credentials.update(extra_credentials)
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            save_args={"use_adbc": True},
+        )
+        data_set.save(pa.Table.from_pandas(sample_pandas_df))
+        adbc.dbapi.connect.assert_not_called()
+        mocked_session.file.put_stream.assert_called_once()
+
+    def test_save_arrow_adbc_missing(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df, mocker
+    ):
+        mocker.patch.dict("sys.modules", {"adbc_driver_snowflake": None})
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            save_args={"use_adbc": True},
+        )
+        data_set.save(pa.Table.from_pandas(sample_pandas_df))
+        mocked_session.file.put_stream.assert_called_once()
+
+
+class TestSnowParkDataSetLoad:
+    def test_load(self, credentials, mocked_session):
+        data_set = spds(table_name="WEATHER_DATA", credentials=credentials)
+        assert data_set.load() is mocked_session.table.return_value
+        mocked_session.table.assert_called_once_with(
+            "DETAILED_DATA.OBSERVATIONS.WEATHER_DATA"
+        )
+
+    def test_load_cache(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            load_args={"cache": True},
+            save_args={"mode": "overwrite"},
+        )
+        cache_result = mocked_session.table.return_value.cache_result
+        assert data_set.load() is data_set.load()
+        cache_result.assert_called_once()
+
+        data_set.save(sample_pandas_df)
+        data_set.load()
+        assert cache_result.call_count == 2
+
+    def test_load_as_arrow(self, credentials, mocked_session, mocker):
+        cursor = mocked_session._conn._conn.cursor.return_value.__enter__.return_value
+        batches = [mocker.MagicMock(), mocker.MagicMock()]
+        batches[0].to_arrow.return_value = pa.table({"A": [1]})
+        batches[1].to_arrow.return_value = pa.table({"A": [2]})
+        cursor.get_result_batches.return_value = batches
+        executor = mocker.patch(
+            "kedro_datasets.snowflake.snowpark_dataset.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        )
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            load_args={"as_arrow": True, "parallel": 2},
+        )
+        assert data_set.load().equals(pa.table({"A": [1, 2]}))
+        cursor.execute.assert_called_once_with(
+            "SELECT * FROM DETAILED_DATA.OBSERVATIONS.WEATHER_DATA"
+        )
+        executor.assert_called_once_with(max_workers=2)
+        mocked_session.table.assert_not_called()
+
+    def test_load_as_arrow_json_results(self, credentials, mocked_session, mocker):
+        cursor = mocked_session._conn._conn.cursor.return_value.__enter__.return_value
+        batch = mocker.MagicMock()
+        batch.to_arrow.side_effect = NotSupportedError("JSON result batch")
+        cursor.get_result_batches.return_value = [batch]
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            load_args={"as_arrow": True},
+        )
+        with pytest.raises(DataSetError, match="Cannot load .* as Arrow"):
+            data_set.load()
+
+    def test_load_async_exists(self, credentials, mocked_session, mocker):
+        calls = mocker.MagicMock()
+        calls.attach_mock(mocked_session.sql.return_value.collect_nowait, "submit")
+        calls.attach_mock(mocked_session.table, "table")
+        job = mocked_session.sql.return_value.collect_nowait.return_value
+        calls.attach_mock(job.result, "result")
+        job.result.return_value = [[1]]
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            load_args={"async_exists": True},
+        )
+        assert data_set.load() is mocked_session.table.return_value
+        assert data_set.exists()
+        # the check is submitted before and awaited after the table is loaded
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "submit",
+            "table",
+            "result",
+        ]
+        mocked_session.sql.return_value.collect.assert_not_called()
+
+    def test_load_async_exists_missing_table(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        job = mocked_session.sql.return_value.collect_nowait.return_value
+        job.result.return_value = [[0]]
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            load_args={"async_exists": True},
+        )
+        with pytest.raises(DataSetError, match="does not exist"):
+            data_set.load()
+        assert not data_set.exists()
+
+        data_set.save(sample_pandas_df)
+        assert data_set.exists()
+        data_set.load()
+        job.result.assert_called_once()
+
+    def test_save_does_not_submit_async_exists(
+        self, credentials, mocked_session, mocked_write_pandas, sample_pandas_df
+    ):
+        data_set = spds(
+            table_name="WEATHER_DATA",
+            credentials=credentials,
+            load_args={"async_exists": True},
+        )
+        data_set.save(sample_pandas_df)
+        assert data_set.exists()
+        mocked_session.sql.return_value.collect_nowait.assert_not_called()